@@ -1,6 +1,13 @@
 """doi2bib3 package shim."""
 
-from .backend import fetch_bibtex
+from .backend import fetch_bibtex, fetch_bibtex_batch
 from .bibitem import fetch_bibitem_aps, format_bibtex_to_aps_bibitem
+from .cache import BibtexCache
 
-__all__ = ["fetch_bibtex", "fetch_bibitem_aps", "format_bibtex_to_aps_bibitem"]
+__all__ = [
+    "BibtexCache",
+    "fetch_bibtex",
+    "fetch_bibtex_batch",
+    "fetch_bibitem_aps",
+    "format_bibtex_to_aps_bibitem",
+]
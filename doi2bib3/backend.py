@@ -16,21 +16,67 @@
 """Identifier resolution and network fetching for BibTeX retrieval."""
 
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Union
 import re
 from urllib.parse import quote, unquote, urlparse
+import xml.etree.ElementTree as ET
 
 import requests
 
-from .constants import USER_AGENT
+from .cache import BibtexCache
 from .normalize import normalize_bibtex
+from .session import SESSION
 
-DOI_PATTERN = re.compile(r"^10\.\d{4,9}/\S+$")
 DOI_IN_TEXT_PATTERN = re.compile(r"10\.\d{4,9}/[^\s'\"<>]+")
 ARXIV_ID_PATTERN = re.compile(r"^(?:\d{4}\.\d+(?:v\d+)?|[A-Za-z\-]+/\d{7}(?:v\d+)?)$")
 ARXIV_DOI_PATTERN = re.compile(r"^10\.48550/arxiv\.(?P<id>.+)$", flags=re.I)
+ARXIV_URL_PATH_PATTERN = re.compile(r"^(?:abs|pdf|html)/(?P<id>.+)$")
+ARXIV_PDF_SUFFIX_PATTERN = re.compile(r"\.pdf$", flags=re.I)
+ARXIV_VERSION_PATTERN = re.compile(r"v\d+$")
+# One scan over the Atom entry; the group that matched tells which source
+# the DOI came from (arxiv:doi element, plain doi element, doi.org link).
+ARXIV_ENTRY_DOI_PATTERN = re.compile(
+    r"<arxiv:doi\b[^>]*>([^<]+)</arxiv:doi>"
+    r"|<doi\b[^>]*>([^<]+)</doi>"
+    r"|href=[\"']https?://(?:dx\.)?doi\.org/([^\"']+)[\"']"
+)
+ARXIV_ATOM_NS = "http://arxiv.org/schemas/atom"
+DOI_ORG_URL_PATTERN = re.compile(r"^https?://(?:dx\.)?doi\.org/(.+)$")
+ARXIV_PRIMARY_CLASS_PATTERN = re.compile(
+    r"<arxiv:primary_category\b[^>]*term=[\"']([^\"']+)[\"']", flags=re.I
+)
+SCIPOST_PATH_PATTERN = re.compile(r"^SciPost[A-Za-z0-9.:-]+$")
+SCIENCEDIRECT_PII_PATTERN = re.compile(r"(?:^|/)pii/([^/?#]+)")
+HTML_DOI_PATTERNS = tuple(
+    re.compile(pattern, flags=re.I)
+    for pattern in (
+        r'<meta[^>]+name=["\']citation_doi["\'][^>]*content=["\']([^"\']+)["\']',
+        r'<meta[^>]+name=["\'](?:dc\.|dcterms\.)?identifier["\'][^>]*content=["\']([^"\']+)["\']',
+        r'href=["\']https?://(?:dx\.)?doi\.org/([^"\']+)["\']',
+        r'(?:href|src)=["\'][^"\']*(10\.\d{4,9}/[^"\']+)["\']',
+        r"(10\.\d{4,9}/[^\s\"'<>]+)",
+    )
+)
 ARXIV_HOSTS = ("arxiv.org", "www.arxiv.org", "xxx.lanl.gov")
 SCHEMELESS_ARXIV_PREFIXES = tuple(f"{host}/" for host in ARXIV_HOSTS)
+ARXIV_PREFIX_LENGTH = max(
+    map(len, SCHEMELESS_ARXIV_PREFIXES + ("arxiv:", "http://", "https://"))
+)
+CROSSREF_BATCH_SIZE = 30
+NON_WORD_PATTERN = re.compile(r"\W+")
+# Crossref work type -> (BibTeX entry type, field for container-title). Other
+# types are fetched from doi.org one by one.
+CROSSREF_BIBTEX_TYPES = {
+    "journal-article": ("article", "journal"),
+    "proceedings-article": ("inproceedings", "booktitle"),
+    "book-chapter": ("incollection", "booktitle"),
+}
+CROSSREF_DATE_KEYS = ("published-print", "published-online", "issued", "published")
+MONTH_MACROS = (
+    "jan", "feb", "mar", "apr", "may", "jun",
+    "jul", "aug", "sep", "oct", "nov", "dec",
+)
 ARXIV_API_URLS = (
     "http://export.arxiv.org/api/query?id_list={id}",
     "https://export.arxiv.org/api/query?id_list={id}",
@@ -51,11 +97,27 @@ class ArxivMetadata:
 
 
 def _is_http_url(value: str) -> bool:
-    lower = value.lower()
-    return lower.startswith("http://") or lower.startswith("https://")
+    return value[:8].lower().startswith(("http://", "https://"))
+
+
+def _is_doi(value: str) -> bool:
+    """Return True for `10.<4-9 digit registrant>/<suffix without whitespace>`."""
+    if not value.startswith("10."):
+        return False
+    slash = value.find("/", 3)
+    if not 7 <= slash <= 12 or not value[3:slash].isdecimal():
+        return False
+    suffix = value[slash + 1:]
+    return suffix.split() == [suffix]
 
 
 def _decode_response_text(resp: requests.Response) -> str:
+    """Decode a response body as UTF-8 without charset sniffing.
+
+    Only a body that is not valid UTF-8 falls back to requests' (slow)
+    content-based detection, then to the header encoding; the header is
+    tried last because providers label such bodies `charset=utf-8` too.
+    """
     try:
         return resp.content.decode("utf-8")
     except Exception:
@@ -63,16 +125,17 @@ def _decode_response_text(resp: requests.Response) -> str:
         return resp.content.decode(enc, errors="replace")
 
 
+@lru_cache(maxsize=512)
 def _parse_doi_string(doi_input: str) -> str:
     """Parse and validate a DOI-like string."""
     candidate = doi_input.strip()
-    if candidate.lower().startswith("doi:"):
+    if candidate[:4].lower() == "doi:":
         candidate = candidate[4:].strip()
     if _is_http_url(candidate):
         parsed = urlparse(candidate)
         candidate = parsed.path.lstrip("/")
     candidate = unquote(candidate)
-    if DOI_PATTERN.match(candidate):
+    if _is_doi(candidate):
         return candidate
     raise DOIError(f"Invalid DOI: {doi_input}")
 
@@ -87,23 +150,24 @@ def _parse_arxiv_id_string(value: str) -> Optional[str]:
     if not value:
         return None
     candidate = value.strip()
-    if candidate.lower().startswith("arxiv:"):
+    # Only prefixes are compared, so lowercase just the leading characters.
+    prefix = candidate[:ARXIV_PREFIX_LENGTH].lower()
+    schemeless = prefix.startswith(SCHEMELESS_ARXIV_PREFIXES)
+    if prefix.startswith("arxiv:"):
         candidate = candidate.split(":", 1)[1].strip()
-    elif _is_http_url(candidate) or candidate.lower().startswith(
-        SCHEMELESS_ARXIV_PREFIXES
-    ):
+    elif schemeless or prefix.startswith(("http://", "https://")):
         try:
-            if candidate.lower().startswith(SCHEMELESS_ARXIV_PREFIXES):
+            if schemeless:
                 candidate = f"https://{candidate}"
             parsed = urlparse(candidate)
         except Exception:
             return None
         if parsed.netloc.lower() not in ARXIV_HOSTS:
             return None
-        m = re.match(r"^(?:abs|pdf|html)/(?P<id>.+)$", parsed.path.lstrip("/"))
+        m = ARXIV_URL_PATH_PATTERN.match(parsed.path.lstrip("/"))
         if not m:
             return None
-        candidate = re.sub(r"\.pdf$", "", m.group("id"), flags=re.I)
+        candidate = ARXIV_PDF_SUFFIX_PATTERN.sub("", m.group("id"))
 
     if ARXIV_ID_PATTERN.match(candidate):
         return candidate
@@ -129,7 +193,7 @@ def _parse_arxiv_id_from_doi_string(value: str) -> Optional[str]:
 
 def _canonical_arxiv_id(arxiv_id: str) -> str:
     """Drop the version suffix from a validated arXiv id."""
-    return re.sub(r"v\d+$", "", arxiv_id)
+    return ARXIV_VERSION_PATTERN.sub("", arxiv_id)
 
 
 def _is_empty_arxiv_feed(text: str) -> bool:
@@ -143,14 +207,14 @@ def _fetch_arxiv_entry(arxiv_id: str, timeout: int = 15) -> str:
     if not parsed:
         raise ValueError("Invalid arXiv ID")
 
-    headers = {"User-Agent": USER_AGENT}
     last_response: Optional[requests.Response] = None
+    last_text = ""
     last_exception: Optional[Exception] = None
 
     for template in ARXIV_API_URLS:
         url = template.format(id=quote(parsed))
         try:
-            resp = requests.get(url, headers=headers, timeout=timeout)
+            resp = SESSION.get(url, timeout=timeout)
         except Exception as exc:
             last_exception = exc
             continue
@@ -158,13 +222,14 @@ def _fetch_arxiv_entry(arxiv_id: str, timeout: int = 15) -> str:
         last_response = resp
         if resp.status_code != 200:
             continue
-        if _is_empty_arxiv_feed(resp.text):
+        last_text = _decode_response_text(resp)
+        if _is_empty_arxiv_feed(last_text):
             continue
-        return resp.text
+        return last_text
 
     if last_response is not None:
         if last_response.status_code == 200:
-            return last_response.text
+            return last_text
         raise DOIError(f"arXiv query failed: HTTP {last_response.status_code}")
     if last_exception is not None:
         raise DOIError(f"arXiv query failed: {last_exception}") from last_exception
@@ -173,37 +238,74 @@ def _fetch_arxiv_entry(arxiv_id: str, timeout: int = 15) -> str:
 
 def _extract_published_doi_from_arxiv_entry(text: str) -> Optional[str]:
     """Extract the journal DOI recorded by arXiv, if present."""
-    patterns = (
-        r"<arxiv:doi\b[^>]*>([^<]+)</arxiv:doi>",
-        r"<doi\b[^>]*>([^<]+)</doi>",
-        r'href=["\']https?://(?:dx\.)?doi\.org/([^"\']+)["\']',
-    )
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            return unquote(match.group(1).strip())
-    return None
+    best: Optional[tuple[int, str]] = None
+    for match in ARXIV_ENTRY_DOI_PATTERN.finditer(text):
+        # Earlier alternatives take precedence wherever they occur in the text.
+        group = match.lastindex
+        if best is None or group < best[0]:
+            best = (group, match.group(group))
+            if group == 1:
+                break
+    if best is None:
+        return None
+    return unquote(best[1].strip())
 
 
 def _extract_primary_class_from_arxiv_entry(text: str) -> Optional[str]:
     """Extract the primary arXiv subject class from an Atom entry."""
-    match = re.search(
-        r"<arxiv:primary_category\b[^>]*term=[\"']([^\"']+)[\"']",
-        text,
-        flags=re.I,
-    )
+    match = ARXIV_PRIMARY_CLASS_PATTERN.search(text)
     if match:
         return match.group(1).strip()
     return None
 
 
+def _parse_arxiv_entry(text: str) -> tuple[Optional[str], Optional[str]]:
+    """Return (primary_class, published_doi) from an arXiv Atom response.
+
+    The response is parsed once with ElementTree; the regex extractors are
+    only used when it is not well-formed XML.
+    """
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError:
+        return (
+            _extract_primary_class_from_arxiv_entry(text),
+            _extract_published_doi_from_arxiv_entry(text),
+        )
+
+    primary_class: Optional[str] = None
+    # Same precedence as the regex path: <arxiv:doi>, <doi>, doi.org link.
+    dois: dict[int, str] = {}
+    for element in root.iter():
+        tag = element.tag
+        if tag == f"{{{ARXIV_ATOM_NS}}}doi":
+            if element.text and element.text.strip():
+                dois.setdefault(1, unquote(element.text.strip()))
+        elif tag.rsplit("}", 1)[-1] == "doi":
+            # Plain <doi> sits in the feed's default (Atom) namespace.
+            if element.text and element.text.strip():
+                dois.setdefault(2, unquote(element.text.strip()))
+        elif tag == f"{{{ARXIV_ATOM_NS}}}primary_category":
+            if primary_class is None and element.get("term"):
+                primary_class = element.get("term").strip()
+
+        href = element.get("href")
+        if href and 3 not in dois:
+            match = DOI_ORG_URL_PATTERN.match(href)
+            if match:
+                dois[3] = unquote(match.group(1).strip())
+
+    return primary_class, dois[min(dois)] if dois else None
+
+
 def _fetch_arxiv_metadata(arxiv_id: str, timeout: int = 15) -> ArxivMetadata:
     """Fetch arXiv metadata used for DOI resolution and BibTeX enrichment."""
     entry = _fetch_arxiv_entry(arxiv_id, timeout=timeout)
+    primary_class, published_doi = _parse_arxiv_entry(entry)
     return ArxivMetadata(
         arxiv_id=_canonical_arxiv_id(arxiv_id),
-        primary_class=_extract_primary_class_from_arxiv_entry(entry),
-        published_doi=_extract_published_doi_from_arxiv_entry(entry),
+        primary_class=primary_class,
+        published_doi=published_doi,
     )
 
 
@@ -254,7 +356,7 @@ def _doi_candidates_from_url_path(url: str) -> list[str]:
         scipost_path = path.strip("/")
         if scipost_path.lower().endswith("/pdf"):
             scipost_path = scipost_path.rsplit("/", 1)[0]
-        if re.match(r"^SciPost[A-Za-z0-9.:-]+$", scipost_path):
+        if SCIPOST_PATH_PATTERN.match(scipost_path):
             return [f"10.21468/{scipost_path}"]
 
     m = DOI_IN_TEXT_PATTERN.search(path)
@@ -263,17 +365,10 @@ def _doi_candidates_from_url_path(url: str) -> list[str]:
 
 def _doi_candidates_from_html(html: str) -> list[str]:
     candidates: list[str] = []
-    patterns = (
-        r'<meta[^>]+name=["\']citation_doi["\'][^>]*content=["\']([^"\']+)["\']',
-        r'<meta[^>]+name=["\'](?:dc\.|dcterms\.)?identifier["\'][^>]*content=["\']([^"\']+)["\']',
-        r'href=["\']https?://(?:dx\.)?doi\.org/([^"\']+)["\']',
-        r'(?:href|src)=["\'][^"\']*(10\.\d{4,9}/[^"\']+)["\']',
-        r"(10\.\d{4,9}/[^\s\"'<>]+)",
-    )
-    for pattern in patterns:
-        for m in re.finditer(pattern, html, flags=re.I):
+    for pattern in HTML_DOI_PATTERNS:
+        for m in pattern.finditer(html):
             raw = m.group(1).strip()
-            if raw.lower().startswith("doi:"):
+            if raw[:4].lower() == "doi:":
                 raw = raw[4:].strip()
             candidates.append(raw)
     return candidates
@@ -289,7 +384,7 @@ def _extract_doi_from_sciencedirect_url(url: str, timeout: int = 10) -> Optional
     if parsed.netloc.lower() not in ("sciencedirect.com", "www.sciencedirect.com"):
         return None
 
-    match = re.search(r"(?:^|/)pii/([^/?#]+)", parsed.path)
+    match = SCIENCEDIRECT_PII_PATTERN.search(parsed.path)
     if not match:
         return None
 
@@ -298,12 +393,9 @@ def _extract_doi_from_sciencedirect_url(url: str, timeout: int = 10) -> Optional
         return None
 
     url = f"https://api.elsevier.com/content/article/pii/{quote(pii, safe='')}"
-    headers = {
-        "Accept": "application/xml, text/xml;q=0.9, application/json;q=0.8",
-        "User-Agent": USER_AGENT,
-    }
+    headers = {"Accept": "application/xml, text/xml;q=0.9, application/json;q=0.8"}
     try:
-        resp = requests.get(url, headers=headers, timeout=timeout)
+        resp = SESSION.get(url, headers=headers, timeout=timeout)
     except Exception:
         return None
 
@@ -321,15 +413,15 @@ def _fetch_html_for_doi_extraction(url: str, timeout: int = 10) -> Optional[str]
     )
 
     try:
-        resp = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=timeout)
+        resp = SESSION.get(url, timeout=timeout)
     except Exception:
         return None
 
-    if resp.status_code == 200 and resp.text:
-        return resp.text
+    if resp.status_code == 200 and resp.content:
+        return _decode_response_text(resp)
 
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             url,
             headers={"User-Agent": ua_browser, "Referer": url},
             timeout=timeout,
@@ -337,8 +429,8 @@ def _fetch_html_for_doi_extraction(url: str, timeout: int = 10) -> Optional[str]
     except Exception:
         return None
 
-    if resp.status_code == 200 and resp.text:
-        return resp.text
+    if resp.status_code == 200 and resp.content:
+        return _decode_response_text(resp)
     return None
 
 
@@ -364,7 +456,6 @@ def _search_doi_via_crossref(query: str, timeout: int = 15) -> Optional[str]:
     if not q:
         return None
 
-    headers = {"User-Agent": USER_AGENT}
     if _is_http_url(q):
         doi = _extract_doi_from_publisher_url(q, timeout=timeout)
         if doi:
@@ -372,7 +463,7 @@ def _search_doi_via_crossref(query: str, timeout: int = 15) -> Optional[str]:
 
     try:
         url = f"https://api.crossref.org/works?query.bibliographic={quote(q)}&rows=5"
-        resp = requests.get(url, headers=headers, timeout=timeout)
+        resp = SESSION.get(url, timeout=timeout)
         if resp.status_code != 200:
             return None
         items = resp.json().get("message", {}).get("items", [])
@@ -435,13 +526,10 @@ def _resolve_identifier(
 
 def _fetch_bibtex_for_doi(doi: str, timeout: int = 15) -> str:
     """Query doi.org for BibTeX and fallback to Crossref transform endpoint."""
-    headers = {
-        "Accept": "application/x-bibtex; charset=utf-8",
-        "User-Agent": USER_AGENT,
-    }
+    headers = {"Accept": "application/x-bibtex; charset=utf-8"}
 
     url = f"https://doi.org/{doi}"
-    resp = requests.get(url, headers=headers, timeout=timeout)
+    resp = SESSION.get(url, headers=headers, timeout=timeout)
     if resp.status_code == 200:
         return _decode_response_text(resp)
 
@@ -450,7 +538,7 @@ def _fetch_bibtex_for_doi(doi: str, timeout: int = 15) -> str:
         "https://api.crossref.org/works/"
         f"{doi_quoted}/transform/application/x-bibtex"
     )
-    resp2 = requests.get(xurl, headers=headers, timeout=timeout)
+    resp2 = SESSION.get(xurl, headers=headers, timeout=timeout)
     if resp2.status_code == 200:
         return _decode_response_text(resp2)
 
@@ -460,10 +548,144 @@ def _fetch_bibtex_for_doi(doi: str, timeout: int = 15) -> str:
     )
 
 
-def fetch_bibtex(identifier: str, timeout: int = 15) -> str:
-    """Public API: resolve identifier and return normalized BibTeX."""
-    doi, arxiv_metadata = _resolve_identifier(identifier, timeout=timeout)
-    raw = _fetch_bibtex_for_doi(doi, timeout=timeout)
+def _crossref_item_to_bibtex(item: dict) -> str:
+    """Format a Crossref works item like Crossref's BibTeX transform output.
+
+    Only types listed in `CROSSREF_BIBTEX_TYPES` are supported.
+    """
+    entry_type, container_field = CROSSREF_BIBTEX_TYPES[item.get("type", "")]
+    doi = item.get("DOI", "")
+    authors = []
+    for author in item.get("author", []):
+        if author.get("family"):
+            given = author.get("given")
+            authors.append(f"{author['family']}, {given}" if given else author["family"])
+        elif author.get("name"):
+            authors.append(author["name"])
+
+    # `published` and `issued` are the earliest of the print and online
+    # dates; doi.org's BibTeX follows the print issue when there is one.
+    date = next(
+        (item[key] for key in CROSSREF_DATE_KEYS if item.get(key)), {}
+    )
+    date_parts = (date.get("date-parts") or [[]])[0] or []
+    year = str(date_parts[0]) if date_parts and date_parts[0] else ""
+    month = date_parts[1] if len(date_parts) > 1 else None
+
+    issn = next(
+        (
+            entry.get("value")
+            for entry in item.get("issn-type", [])
+            if entry.get("type") == "electronic"
+        ),
+        (item.get("ISSN") or [""])[0],
+    )
+
+    fields = [
+        ("title", (item.get("title") or [""])[0]),
+        ("volume", item.get("volume")),
+        ("ISSN", issn),
+        ("url", f"http://dx.doi.org/{doi}"),
+        ("DOI", doi),
+        ("number", item.get("issue")),
+        (container_field, (item.get("container-title") or [""])[0]),
+        ("publisher", item.get("publisher")),
+        ("author", " and ".join(authors)),
+        ("year", year),
+        # Journals that number articles (APS among them) often leave page
+        # empty; normalize_bibtex would otherwise look each one up again.
+        ("pages", item.get("page") or item.get("article-number")),
+    ]
+    lines = [f" {name}={{{value}}}" for name, value in fields if value]
+    if isinstance(month, int) and 1 <= month <= 12:
+        lines.append(f" month={MONTH_MACROS[month - 1]}")
+
+    first_author = item.get("author", [{}])[0] if item.get("author") else {}
+    key_name = NON_WORD_PATTERN.sub("", first_author.get("family", "")) or "entry"
+    key = "_".join(part for part in (key_name, year) if part)
+    return f"@{entry_type}{{{key},\n" + ",\n".join(lines) + "\n}\n"
+
+
+def _fetch_crossref_items(dois: list[str], timeout: int = 15) -> dict[str, dict]:
+    """Fetch Crossref metadata for several DOIs with one filter query."""
+    doi_filter = ",".join(f"doi:{doi}" for doi in dois)
+    url = (
+        "https://api.crossref.org/works?"
+        f"filter={quote(doi_filter, safe=':,/')}&rows={len(dois)}"
+    )
+    try:
+        resp = SESSION.get(url, timeout=timeout)
+        if resp.status_code != 200:
+            return {}
+        items = resp.json().get("message", {}).get("items", [])
+    except Exception:
+        return {}
+    return {item["DOI"].lower(): item for item in items if item.get("DOI")}
+
+
+def _fetch_bibtex_for_dois(
+    dois: list[str],
+    timeout: int = 15,
+    cache: Optional[BibtexCache] = None,
+    refresh: bool = False,
+) -> dict[str, Union[str, Exception]]:
+    """Fetch raw BibTeX for several DOIs, keyed by lowercased DOI.
+
+    Crossref DOIs are fetched in chunks through the works filter API and
+    formatted locally. arXiv DOIs, DOIs Crossref does not return or whose
+    type has no local formatter, and DOIs that cannot be expressed in a
+    filter fall back to `_fetch_bibtex_for_doi`. A DOI that cannot be
+    fetched maps to the exception raised for it.
+
+    Only doi.org/Crossref transform output is stored in `cache`; locally
+    formatted entries are not, so `fetch_bibtex` never reads them back.
+    """
+    unique: dict[str, str] = {}
+    for doi in dois:
+        unique.setdefault(doi.lower(), doi)
+
+    raw_by_doi: dict[str, Union[str, Exception]] = {}
+    if cache is not None and not refresh:
+        for key, doi in unique.items():
+            cached = cache.get(doi)
+            if cached is not None:
+                raw_by_doi[key] = cached
+    fetched: set[str] = set()
+
+    bulk = [
+        doi
+        for key, doi in unique.items()
+        if key not in raw_by_doi
+        and "," not in doi
+        and not ARXIV_DOI_PATTERN.match(doi)
+    ]
+    for start in range(0, len(bulk), CROSSREF_BATCH_SIZE):
+        items = _fetch_crossref_items(
+            bulk[start:start + CROSSREF_BATCH_SIZE], timeout=timeout
+        )
+        for key, item in items.items():
+            if key in unique and item.get("type") in CROSSREF_BIBTEX_TYPES:
+                raw_by_doi[key] = _crossref_item_to_bibtex(item)
+
+    for key, doi in unique.items():
+        if key not in raw_by_doi:
+            try:
+                raw_by_doi[key] = _fetch_bibtex_for_doi(doi, timeout=timeout)
+            except Exception as e:
+                raw_by_doi[key] = e
+                continue
+            fetched.add(key)
+
+    if cache is not None:
+        for key in fetched:
+            cache.set(unique[key], raw_by_doi[key])
+    return raw_by_doi
+
+
+def _normalize_fetched_bibtex(
+    raw: str, arxiv_metadata: Optional[ArxivMetadata]
+) -> str:
+    """Normalize fetched BibTeX, returning it unchanged if that fails."""
     try:
         include_arxiv_fields = bool(
             arxiv_metadata and not arxiv_metadata.published_doi
@@ -478,3 +700,64 @@ def fetch_bibtex(identifier: str, timeout: int = 15) -> str:
         )
     except Exception:
         return raw
+
+
+def fetch_bibtex(
+    identifier: str,
+    timeout: int = 15,
+    cache: Optional[BibtexCache] = None,
+    refresh: bool = False,
+) -> str:
+    """Public API: resolve identifier and return normalized BibTeX.
+
+    With a `cache`, raw BibTeX is looked up by DOI before fetching and stored
+    afterwards; `refresh=True` skips the lookup but still stores the result.
+    """
+    doi, arxiv_metadata = _resolve_identifier(identifier, timeout=timeout)
+    raw = cache.get(doi) if cache is not None and not refresh else None
+    if raw is None:
+        raw = _fetch_bibtex_for_doi(doi, timeout=timeout)
+        if cache is not None:
+            cache.set(doi, raw)
+    return _normalize_fetched_bibtex(raw, arxiv_metadata)
+
+
+def fetch_bibtex_batch(
+    identifiers: list[str],
+    timeout: int = 15,
+    cache: Optional[BibtexCache] = None,
+    refresh: bool = False,
+) -> list[tuple[Optional[str], Optional[Exception]]]:
+    """Public API: resolve identifiers and return normalized BibTeX in order.
+
+    Each identifier yields `(bibtex, None)` on success or `(None, error)` if
+    it cannot be resolved or fetched, so one bad identifier does not fail
+    the batch. Crossref metadata is fetched in bulk, so N DOIs cost about
+    N / 30 requests instead of N. `cache` and `refresh` behave as in
+    `fetch_bibtex`.
+    """
+    resolved: list[Union[tuple[str, Optional[ArxivMetadata]], Exception]] = []
+    for identifier in identifiers:
+        try:
+            resolved.append(_resolve_identifier(identifier, timeout=timeout))
+        except Exception as e:
+            resolved.append(e)
+
+    raw_by_doi = _fetch_bibtex_for_dois(
+        [item[0] for item in resolved if not isinstance(item, Exception)],
+        timeout=timeout,
+        cache=cache,
+        refresh=refresh,
+    )
+    results: list[tuple[Optional[str], Optional[Exception]]] = []
+    for item in resolved:
+        if isinstance(item, Exception):
+            results.append((None, item))
+            continue
+        doi, arxiv_metadata = item
+        raw = raw_by_doi[doi.lower()]
+        if isinstance(raw, Exception):
+            results.append((None, raw))
+        else:
+            results.append((_normalize_fetched_bibtex(raw, arxiv_metadata), None))
+    return results
@@ -0,0 +1,96 @@
+# Copyright (c) 2025 Archisman Panigrahi <apandada1ATgmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Persistent DOI -> raw BibTeX cache."""
+
+from contextlib import closing
+from typing import Optional
+import os
+import sqlite3
+import threading
+import time
+
+
+def default_cache_path() -> str:
+    """Return the cache database path under the user cache directory."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "doi2bib3", "doi_cache.sqlite")
+
+
+class BibtexCache:
+    """SQLite-backed cache of raw BibTeX keyed by lowercased DOI.
+
+    Raw provider output is cached (not normalized BibTeX), so normalization
+    changes apply to cached entries too. Entries never expire unless `ttl`
+    (seconds) is given. Cache errors are ignored: a broken cache only costs
+    a network request.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = None):
+        self.path = path or default_cache_path()
+        self.ttl = ttl
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _ensure_schema(self) -> None:
+        with self._init_lock:
+            if self._initialized:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with closing(sqlite3.connect(self.path, timeout=10)) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS bibtex "
+                    "(doi TEXT PRIMARY KEY, bibtex TEXT NOT NULL, fetched REAL NOT NULL)"
+                )
+            self._initialized = True
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections cannot be shared between threads by default, so
+        # each operation opens its own; the directory and table are created
+        # on first use only.
+        if not self._initialized:
+            self._ensure_schema()
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, doi: str) -> Optional[str]:
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT bibtex, fetched FROM bibtex WHERE doi = ?",
+                    (doi.lower(),),
+                ).fetchone()
+        except (OSError, sqlite3.Error):
+            return None
+        if row is None:
+            return None
+        bibtex, fetched = row
+        if self.ttl is not None and time.time() - fetched > self.ttl:
+            return None
+        return bibtex
+
+    def set(self, doi: str, bibtex: str) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO bibtex (doi, bibtex, fetched) "
+                    "VALUES (?, ?, ?)",
+                    (doi.lower(), bibtex, time.time()),
+                )
+        except (OSError, sqlite3.Error):
+            pass
@@ -6,23 +6,19 @@ import os
 
 
 def save_bibtex_to_file(bib_str: str, path: str, append: bool = False) -> None:
+    data = bib_str.encode("utf-8")
     if not append:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(bib_str)
+        with open(path, "wb") as f:
+            f.write(data)
         return
 
-    prefix = ""
-    try:
-        if os.path.exists(path) and os.path.getsize(path) > 0:
-            with open(path, "rb") as fh:
-                fh.seek(-1, os.SEEK_END)
-                last = fh.read(1)
-            if last != b"\n":
-                prefix = "\n"
-    except OSError:
-        prefix = "\n"
-
-    with open(path, "a", encoding="utf-8") as f:
-        if prefix:
-            f.write(prefix)
-        f.write(bib_str)
+    # "a+b" always writes at the end of the file but still allows reading,
+    # so checking the last byte and appending share one open file.
+    with open(path, "a+b") as f:
+        prefix = b""
+        end = f.seek(0, os.SEEK_END)
+        if end > 0:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                prefix = b"\n"
+        f.write(prefix + data)
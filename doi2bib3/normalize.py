@@ -15,6 +15,7 @@
 
 """BibTeX normalization helpers."""
 
+from functools import lru_cache
 from typing import Optional
 import html
 import json
@@ -25,10 +26,11 @@ import urllib.parse
 import xml.etree.ElementTree as ET
 
 import bibtexparser
+from bibtexparser.bibdatabase import STANDARD_TYPES
 from bibtexparser.bparser import BibTexParser
-import requests
+from bibtexparser.bwriter import BibTexWriter
 
-from .constants import USER_AGENT
+from .session import SESSION
 
 LATEX_DIACRITIC_COMMANDS = {
     "\u0300": "\\`",
@@ -68,7 +70,13 @@ SPECIAL_CHARS = {
     "\u0237": "{\\j}",
 }
 
-_TEXT_FIELDS_LATEX_ENCODING = {"author", "booktitle", "title"}
+SPECIAL_CHARS_TRANS = str.maketrans(SPECIAL_CHARS)
+NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+_MISSING_PAGES = ("n/a-n/a", "na-na", "n/a", "na")
+PAGE_RANGE_RE = re.compile(r"(?<=\d)\s*-[\u2013\u2014-]?\s*(?=\d)")
+
+_TEXT_FIELDS_LATEX_ENCODING = ("author", "booktitle", "title")
 
 _MONTH_STRING_DEFINITIONS = """@string{jan = \"January\"}
 @string{january = \"January\"}
@@ -95,6 +103,27 @@ _MONTH_STRING_DEFINITIONS = """@string{jan = \"January\"}
 @string{dec = \"December\"}
 @string{december = \"December\"}
 """
+_MONTH_MACROS = dict(
+    re.findall(r'@string\{(\w+) = "(\w+)"\}', _MONTH_STRING_DEFINITIONS)
+)
+
+# Single-entry scanner used by normalize_bibtex before falling back to the
+# full bibtexparser grammar. Whitespace matches pyparsing's default set.
+_ENTRY_HEADER_RE = re.compile(
+    r"[ \t\r\n]*@([A-Za-z]+)[ \t\r\n]*\{[ \t\r\n]*([^,\s]+)[ \t\r\n]*,"
+)
+_ENTRY_END_RE = re.compile(r"[ \t\r\n]*\}[ \t\r\n]*\Z")
+_FIELD_NAME_RE = re.compile(r"[ \t\r\n]*([A-Za-z0-9_\-().+]+)[ \t\r\n]*=[ \t\r\n]*")
+_FIELD_SEP_RE = re.compile(r"[ \t\r\n]*(?:,|(?=\}))")
+_BARE_VALUE_RE = re.compile(r"[A-Za-z0-9_\-:]+")
+_BRACE_RE = re.compile(r"[{}]")
+_QUOTED_DELIM_RE = re.compile(r'[{}"]')
+
+# Used for bibtexparser fallback output; single entries use _entry_to_bibtex.
+# BibTexWriter only holds formatting options, so one instance can be shared.
+# BibTexParser accumulates every parsed entry in its database and must stay
+# per call.
+_BIBTEX_WRITER = BibTexWriter()
 
 VAR_RE = re.compile(r"(\\{)(\\var[A-Z]?[a-z]*)(\\})")
 
@@ -224,6 +253,9 @@ def normalize_title_whitespace(title: str) -> str:
 
 
 def insert_dollars(title: str) -> str:
+    if "\\var" not in title:
+        return title
+
     return VAR_RE.sub(r"\\1$\\2$\\3", title)
 
 
@@ -257,36 +289,34 @@ def protect_capitalized_words(title: str) -> str:
     return "".join(result)
 
 
-def encode_special_chars(value: str) -> str:
-    value = unicodedata.normalize("NFC", value)
-    encoded = []
-    for char in value:
-        special_char = SPECIAL_CHARS.get(char)
-        if special_char:
-            encoded.append(special_char)
-            continue
+def _encode_diacritic_char(match: re.Match) -> str:
+    char = match.group(0)
+    normalized = unicodedata.normalize("NFD", char)
+    if len(normalized) == 1:
+        return char
+
+    base = normalized[0]
+    marks = normalized[1:]
+    if not base.isalpha() or not all(mark in LATEX_DIACRITIC_COMMANDS for mark in marks):
+        return char
 
-        if ord(char) < 128:
-            encoded.append(char)
-            continue
+    letter = base
+    for mark in marks:
+        letter = f"{LATEX_DIACRITIC_COMMANDS[mark]}{{{letter}}}"
+    return letter
 
-        normalized = unicodedata.normalize("NFD", char)
-        if len(normalized) == 1:
-            encoded.append(char)
-            continue
 
-        base = normalized[0]
-        marks = normalized[1:]
-        if not base.isalpha() or not all(mark in LATEX_DIACRITIC_COMMANDS for mark in marks):
-            encoded.append(char)
-            continue
+@lru_cache(maxsize=1024)
+def encode_special_chars(value: str) -> str:
+    value = unicodedata.normalize("NFC", value)
+    if value.isascii():
+        return value
 
-        letter = base
-        for mark in marks:
-            letter = f"{LATEX_DIACRITIC_COMMANDS[mark]}{{{letter}}}"
-        encoded.append(letter)
+    value = value.translate(SPECIAL_CHARS_TRANS)
+    if value.isascii():
+        return value
 
-    return "".join(encoded)
+    return NON_ASCII_RE.sub(_encode_diacritic_char, value)
 
 
 def _local_name(tag: str) -> str:
@@ -439,15 +469,111 @@ def ascii_for_bibtex_key(value: str) -> str:
     return "".join(char for char in value if not unicodedata.combining(char))
 
 
+def _strip_after_new_lines(value: str) -> str:
+    """Match bibtexparser's handling of indentation in multi-line values."""
+    lines = value.splitlines()
+    if len(lines) > 1:
+        lines = [lines[0]] + [line.lstrip() for line in lines[1:]]
+    return "\n".join(lines)
+
+
+def _scan_delimited(text: str, pos: int, delim_re: re.Pattern) -> Optional[int]:
+    """Return the index after the value opened at text[pos], or None."""
+    opener = text[pos]
+    depth = 0
+    for match in delim_re.finditer(text, pos + 1):
+        char = match.group(0)
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            if depth == 0:
+                return match.end() if opener == "{" else None
+            depth -= 1
+        elif depth == 0:
+            return match.end()
+    return None
+
+
+def _scan_field_value(text: str, pos: int) -> tuple[Optional[str], int]:
+    char = text[pos:pos + 1]
+    if char in ("{", '"'):
+        end = _scan_delimited(
+            text, pos, _BRACE_RE if char == "{" else _QUOTED_DELIM_RE
+        )
+        if end is None:
+            return None, pos
+        return _strip_after_new_lines(text[pos + 1:end - 1]), end
+
+    match = _BARE_VALUE_RE.match(text, pos)
+    if not match:
+        return None, pos
+    token = match.group(0)
+    if token.isdigit():
+        return token, match.end()
+    return _MONTH_MACROS.get(token.lower()), match.end()
+
+
+def _parse_single_entry(bib_str: str) -> Optional[dict]:
+    """Parse one plain BibTeX entry without building the pyparsing grammar.
+
+    Returns None for anything outside the simple shape served by doi.org and
+    Crossref (several entries, comments, string macros, concatenation), so
+    the caller can fall back to bibtexparser.
+    """
+    # pyparsing expands tabs in the whole input before parsing.
+    if "\t" in bib_str:
+        bib_str = bib_str.expandtabs()
+    header = _ENTRY_HEADER_RE.match(bib_str)
+    if not header:
+        return None
+    entry_type = header.group(1).lower()
+    if entry_type not in STANDARD_TYPES:
+        return None
+
+    entry = {}
+    pos = header.end()
+    while not _ENTRY_END_RE.match(bib_str, pos):
+        field = _FIELD_NAME_RE.match(bib_str, pos)
+        if not field:
+            return None
+        key = field.group(1).lower()
+        if key in entry:
+            return None
+        value, pos = _scan_field_value(bib_str, field.end())
+        if value is None:
+            return None
+        entry[key] = "" if value == "{}" else value
+        sep = _FIELD_SEP_RE.match(bib_str, pos)
+        if not sep:
+            return None
+        pos = sep.end()
+
+    if not entry:
+        return None
+    entry["ENTRYTYPE"] = entry_type
+    entry["ID"] = header.group(2)
+    return entry
+
+
+def _entry_to_bibtex(entry: dict) -> str:
+    """Serialize one entry in the same layout as the default BibTexWriter."""
+    fields = "".join(
+        f",\n {key} = {{{entry[key]}}}"
+        for key in sorted(entry)
+        if key not in ("ENTRYTYPE", "ID")
+    )
+    return f"@{entry['ENTRYTYPE']}{{{entry['ID']}{fields}\n}}\n"
+
+
 def fetch_article_number_from_crossref(doi: str, timeout: int = 10) -> Optional[str]:
     """Fetch article-number from Crossref API for a given DOI."""
     try:
         doi_clean = doi.strip()
-        if doi_clean.lower().startswith("doi:"):
+        if doi_clean[:4].lower() == "doi:":
             doi_clean = doi_clean[4:].strip()
 
         url = f'https://api.crossref.org/works/{urllib.parse.quote(doi_clean, safe="")}'
-        resp = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=timeout)
+        resp = SESSION.get(url, timeout=timeout)
 
         if resp.status_code == 200:
             data = resp.json()
@@ -465,18 +591,19 @@ def normalize_bibtex(
     primary_class: Optional[str] = None,
     include_arxiv_fields: bool = False,
 ) -> str:
-    # Some providers return month macros like month=july without defining
-    # them, which makes bibtexparser raise UndefinedString.
-    parser = BibTexParser(common_strings=False)
-    bib_db = bibtexparser.loads(
-        _MONTH_STRING_DEFINITIONS + "\n" + bib_str,
-        parser=parser,
-    )
-    # Keep resolved values in entries while omitting helper @string blocks.
-    bib_db.strings = {}
-    for entry in bib_db.entries:
-        if "ID" in entry:
-            entry["ID"] = entry["ID"].replace("_", "")
+    single_entry = _parse_single_entry(bib_str)
+    bib_db = None
+    if single_entry is None:
+        # Some providers return month macros like month=july without defining
+        # them, which makes bibtexparser raise UndefinedString.
+        parser = BibTexParser(common_strings=False)
+        bib_db = bibtexparser.loads(
+            _MONTH_STRING_DEFINITIONS + "\n" + bib_str,
+            parser=parser,
+        )
+        # Keep resolved values in entries while omitting helper @string blocks.
+        bib_db.strings = {}
+    entries = [single_entry] if bib_db is None else bib_db.entries
 
     def _make_bibtex_key(entry):
         def _clean(s, lower=True):
@@ -519,19 +646,19 @@ def normalize_bibtex(
 
         return base
 
-    for entry in bib_db.entries:
+    for entry in entries:
         new_id = _make_bibtex_key(entry)
         entry["ID"] = new_id
         pages = entry.get("pages")
         if pages:
-            norm = pages.strip().lower()
-            if norm in ("n/a-n/a", "na-na", "n/a", "na"):
+            norm = pages.strip()
+            # Placeholders all start with "n"; numeric pages skip lower().
+            if norm[:1] in ("n", "N") and norm.lower() in _MISSING_PAGES:
                 entry.pop("pages", None)
             else:
-                p = pages
-                p = p.replace("\u2013", "--").replace("\u2014", "--")
-                p = p.replace("–", "--").replace("—", "--")
-                p = re.sub(r"(?<=\d)\s*-[\u2013\u2014-]?\s*(?=\d)", "--", p)
+                p = pages.replace("\u2013", "--").replace("\u2014", "--")
+                if "-" in p:
+                    p = PAGE_RANGE_RE.sub("--", p)
                 entry["pages"] = p
 
         if not pages:
@@ -541,30 +668,35 @@ def normalize_bibtex(
                 if article_num:
                     entry["pages"] = article_num
 
-        if "url" in entry:
-            entry["url"] = urllib.parse.unquote(entry["url"])
+        url = entry.get("url")
+        if url is not None:
+            entry["url"] = urllib.parse.unquote(url)
             entry.pop("doi", None)
 
-        if "title" in entry:
-            entry["title"] = unicodedata.normalize("NFC", entry["title"])
-            entry["title"] = mathml_to_latex(entry["title"])
-            entry["title"] = html_italics_to_latex(entry["title"])
-            entry["title"] = insert_dollars(entry["title"])
-            entry["title"] = plus_minus_to_latex(entry["title"])
-            entry["title"] = chemical_formulas_to_latex(entry["title"])
-            entry["title"] = ensure_space_around_math(entry["title"])
-            entry["title"] = escape_latex_chars(entry["title"], "&%#")
-            entry["title"] = normalize_title_whitespace(entry["title"])
-            entry["title"] = protect_capitalized_words(entry["title"])
-
-        if "journal" in entry:
-            entry["journal"] = abbreviate_journal_name(entry["journal"])
-            entry["journal"] = escape_latex_chars(entry["journal"], "&")
-
-        if "month" in entry:
-            entry["month"] = entry["month"].strip()
-            if entry["month"].startswith("{") and entry["month"].endswith("}"):
-                entry["month"] = entry["month"][1:-1]
+        title = entry.get("title")
+        if title is not None:
+            title = unicodedata.normalize("NFC", title)
+            title = mathml_to_latex(title)
+            title = html_italics_to_latex(title)
+            title = insert_dollars(title)
+            title = plus_minus_to_latex(title)
+            title = chemical_formulas_to_latex(title)
+            title = ensure_space_around_math(title)
+            title = escape_latex_chars(title, "&%#")
+            title = normalize_title_whitespace(title)
+            entry["title"] = protect_capitalized_words(title)
+
+        journal = entry.get("journal")
+        if journal is not None:
+            journal = abbreviate_journal_name(journal)
+            entry["journal"] = escape_latex_chars(journal, "&")
+
+        month = entry.get("month")
+        if month is not None:
+            month = month.strip()
+            if month.startswith("{") and month.endswith("}"):
+                month = month[1:-1]
+            entry["month"] = month
 
         if include_arxiv_fields and arxiv_id:
             entry["archivePrefix"] = "arXiv"
@@ -573,7 +705,10 @@ def normalize_bibtex(
                 entry["primaryClass"] = primary_class
 
         for key in _TEXT_FIELDS_LATEX_ENCODING:
-            if key in entry:
-                entry[key] = encode_special_chars(entry[key])
+            value = entry.get(key)
+            if value is not None:
+                entry[key] = encode_special_chars(value)
 
-    return bibtexparser.dumps(bib_db)
+    if bib_db is None:
+        return _entry_to_bibtex(single_entry)
+    return _BIBTEX_WRITER.write(bib_db)
@@ -0,0 +1,67 @@
+# Copyright (c) 2025 Archisman Panigrahi <apandada1ATgmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Shared HTTP session for all network lookups."""
+
+from functools import lru_cache
+import socket
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .constants import USER_AGENT
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with connection pooling and retries."""
+    # raise_on_status=False hands the last response back after retries, so
+    # callers keep their own status-code fallbacks.
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+SESSION = _build_session()
+
+
+def install_dns_cache(maxsize: int = 32) -> None:
+    """Cache successful `socket.getaddrinfo` results for the process lifetime.
+
+    The session's pool reuses connections, but each new connection (a new
+    host, or another worker thread) still resolves its host again. This
+    patches the process-wide resolver, so it is meant for the CLI rather than
+    for library callers. Failed lookups are not cached.
+    """
+    if getattr(socket.getaddrinfo, "doi2bib3_dns_cache", False):
+        return
+
+    resolve = lru_cache(maxsize=maxsize)(socket.getaddrinfo)
+
+    def getaddrinfo(*args, **kwargs):
+        return list(resolve(*args, **kwargs))
+
+    getaddrinfo.doi2bib3_dns_cache = True
+    socket.getaddrinfo = getaddrinfo
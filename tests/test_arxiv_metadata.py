@@ -27,7 +27,7 @@ def _install_fake_get(monkeypatch, responses, called_urls):
             raise response
         return response
 
-    monkeypatch.setattr(backend.requests, "get", fake_get)
+    monkeypatch.setattr(backend.SESSION, "get", fake_get)
 
 
 @pytest.mark.imported
@@ -189,3 +189,68 @@ def test_fetch_bibtex_skips_arxiv_fields_when_journal_doi_exists(monkeypatch):
     assert "eprint" not in bibtex
     assert "primaryClass" not in bibtex
     assert f"https://doi.org/{journal_doi}" in bibtex
+
+
+@pytest.mark.imported
+def test_arxiv_doi_element_takes_precedence_over_earlier_doi_link():
+    text = """
+    <entry>
+      <link title="doi" href="https://doi.org/10.9999/link%2Fdoi" rel="related"/>
+      <arxiv:doi>10.9999/element.doi</arxiv:doi>
+    </entry>
+    """
+
+    assert backend._extract_published_doi_from_arxiv_entry(text) == "10.9999/element.doi"
+    assert (
+        backend._extract_published_doi_from_arxiv_entry(text.replace("arxiv:doi", "x"))
+        == "10.9999/link/doi"
+    )
+
+
+@pytest.mark.imported
+def test_parse_arxiv_entry_reads_atom_feed():
+    text = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <entry>
+    <link title="doi" href="http://dx.doi.org/10.1103/PhysRevB.1.2" rel="related"/>
+    <arxiv:doi>10.1103/PhysRevB.1.2</arxiv:doi>
+    <arxiv:primary_category term="cond-mat.str-el" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+</feed>
+"""
+
+    assert backend._parse_arxiv_entry(text) == ("cond-mat.str-el", "10.1103/PhysRevB.1.2")
+    assert backend._parse_arxiv_entry(text.replace("arxiv:doi", "arxiv:x")) == (
+        "cond-mat.str-el",
+        "10.1103/PhysRevB.1.2",
+    )
+    assert backend._parse_arxiv_entry("<feed><entry/></feed>") == (None, None)
+
+
+@pytest.mark.imported
+def test_parse_arxiv_entry_reads_plain_doi_in_atom_namespace():
+    text = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <link title="doi" href="https://doi.org/10.9999/link.doi" rel="related"/>
+    <doi>10.9999/element%2Fdoi</doi>
+  </entry>
+</feed>
+"""
+
+    assert backend._parse_arxiv_entry(text) == (None, "10.9999/element/doi")
+    assert backend._extract_published_doi_from_arxiv_entry(text) == "10.9999/element/doi"
+
+
+@pytest.mark.imported
+def test_parse_arxiv_entry_unquotes_arxiv_doi_element():
+    text = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <entry>
+    <arxiv:doi>10.1103/ABC%3Cx</arxiv:doi>
+  </entry>
+</feed>
+"""
+
+    assert backend._parse_arxiv_entry(text) == (None, "10.1103/ABC<x")
+    assert backend._extract_published_doi_from_arxiv_entry(text) == "10.1103/ABC<x"
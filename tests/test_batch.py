@@ -0,0 +1,245 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from doi2bib3 import backend
+from doi2bib3.cache import BibtexCache
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text="", json_data=None):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.apparent_encoding = "utf-8"
+        self.encoding = "utf-8"
+        self._json_data = json_data
+
+    def json(self):
+        return self._json_data
+
+
+def _install_fake_get(monkeypatch, responses, called_urls):
+    def fake_get(url, headers=None, timeout=None):
+        called_urls.append(url)
+        response = responses.get(url)
+        if response is None:
+            raise AssertionError(f"Unexpected URL: {url}")
+        return response
+
+    monkeypatch.setattr(backend.SESSION, "get", fake_get)
+
+
+CROSSREF_ITEM = {
+    "DOI": "10.1038/nphys1170",
+    "type": "journal-article",
+    "title": ["Measured measurement"],
+    "volume": "5",
+    "issue": "1",
+    "page": "11-12",
+    "ISSN": ["1745-2473", "1745-2481"],
+    "issn-type": [
+        {"type": "print", "value": "1745-2473"},
+        {"type": "electronic", "value": "1745-2481"},
+    ],
+    "container-title": ["Nature Physics"],
+    "publisher": "Springer Science and Business Media LLC",
+    "author": [{"given": "Markus", "family": "Aspelmeyer"}],
+    "published-print": {"date-parts": [[2009, 1]]},
+    "published-online": {"date-parts": [[2008, 12, 21]]},
+    "published": {"date-parts": [[2008, 12, 21]]},
+    "issued": {"date-parts": [[2008, 12, 21]]},
+}
+
+
+@pytest.mark.imported
+def test_crossref_item_to_bibtex_matches_transform_shape():
+    bibtex = backend._crossref_item_to_bibtex(CROSSREF_ITEM)
+
+    assert bibtex.startswith("@article{Aspelmeyer_2009,\n")
+    assert " author={Aspelmeyer, Markus}" in bibtex
+    assert " url={http://dx.doi.org/10.1038/nphys1170}" in bibtex
+    assert " ISSN={1745-2481}" in bibtex
+    assert " month=jan" in bibtex
+
+
+@pytest.mark.imported
+def test_crossref_item_to_bibtex_uses_booktitle_for_proceedings():
+    item = {
+        "DOI": "10.1109/cvpr.2016.90",
+        "type": "proceedings-article",
+        "title": ["Deep Residual Learning for Image Recognition"],
+        "container-title": [
+            "2016 IEEE Conference on Computer Vision and Pattern Recognition (CVPR)"
+        ],
+        "publisher": "IEEE",
+        "author": [{"given": "Kaiming", "family": "He"}],
+        "published": {"date-parts": [[2016, 6]]},
+        "page": "770-778",
+    }
+
+    bibtex = backend._crossref_item_to_bibtex(item)
+
+    assert bibtex.startswith("@inproceedings{He_2016,\n")
+    assert " booktitle={2016 IEEE Conference on Computer Vision" in bibtex
+    assert "journal=" not in bibtex
+
+
+@pytest.mark.imported
+def test_fetch_bibtex_batch_fetches_unsupported_types_from_doi_org(monkeypatch):
+    called_urls = []
+    book_doi = "10.1007/978-3-030-00001-1"
+    book_item = {
+        "DOI": book_doi,
+        "type": "monograph",
+        "title": ["A Book"],
+        "author": [{"given": "Jane", "family": "Doe"}],
+    }
+    responses = {
+        f"https://api.crossref.org/works?filter=doi:{book_doi}&rows=1": FakeResponse(
+            json_data={"message": {"items": [book_item]}}
+        ),
+        f"https://doi.org/{book_doi}": FakeResponse(
+            text="""@book{Doe_2020,
+ title = {A Book},
+ author = {Doe, Jane},
+ year = {2020},
+ publisher = {Springer}
+}
+"""
+        ),
+    }
+    _install_fake_get(monkeypatch, responses, called_urls)
+
+    [(bibtex, error)] = backend.fetch_bibtex_batch([book_doi])
+
+    assert error is None
+    assert "@book{Doe_a_2020," in bibtex
+    assert called_urls[-1] == f"https://doi.org/{book_doi}"
+
+
+@pytest.mark.imported
+def test_fetch_bibtex_batch_uses_one_crossref_query(monkeypatch):
+    called_urls = []
+    missing_doi = "10.9999/missing.1"
+    responses = {
+        (
+            "https://api.crossref.org/works?"
+            f"filter=doi:10.1038/nphys1170,doi:{missing_doi}&rows=2"
+        ): FakeResponse(json_data={"message": {"items": [CROSSREF_ITEM]}}),
+        f"https://doi.org/{missing_doi}": FakeResponse(
+            text="""@article{sample,
+ author = {Doe, Jane},
+ title = {Not indexed},
+ year = {2025},
+ pages = {7},
+ url = {https://doi.org/10.9999/missing.1}
+}
+"""
+        ),
+    }
+    _install_fake_get(monkeypatch, responses, called_urls)
+
+    results = backend.fetch_bibtex_batch(
+        ["https://doi.org/10.1038/nphys1170", missing_doi]
+    )
+
+    assert [error for _, error in results] == [None, None]
+    bibtex = [bib for bib, _ in results]
+    assert "@article{Aspelmeyer_measured_2009," in bibtex[0]
+    assert "journal = {Nat. Phys.}" in bibtex[0]
+    assert "month = {January}" in bibtex[0]
+    assert "pages = {11--12}" in bibtex[0]
+    assert "@article{Doe_not_2025," in bibtex[1]
+    assert len(called_urls) == 2
+
+
+@pytest.mark.imported
+def test_fetch_bibtex_batch_reports_failures_per_identifier(monkeypatch):
+    called_urls = []
+    gone_doi = "10.9999/gone"
+    responses = {
+        (
+            "https://api.crossref.org/works?"
+            f"filter=doi:10.1038/nphys1170,doi:{gone_doi}&rows=2"
+        ): FakeResponse(json_data={"message": {"items": [CROSSREF_ITEM]}}),
+        f"https://doi.org/{gone_doi}": FakeResponse(status_code=404),
+        (
+            "https://api.crossref.org/works/10.9999%2Fgone/transform/"
+            "application/x-bibtex"
+        ): FakeResponse(status_code=404),
+        "https://api.crossref.org/works?query.bibliographic=typo&rows=5": FakeResponse(
+            json_data={"message": {"items": []}}
+        ),
+    }
+    _install_fake_get(monkeypatch, responses, called_urls)
+
+    results = backend.fetch_bibtex_batch(["10.1038/nphys1170", gone_doi, "typo"])
+
+    assert "@article{Aspelmeyer_measured_2009," in results[0][0]
+    assert results[0][1] is None
+    assert results[1][0] is None
+    assert isinstance(results[1][1], backend.DOIError)
+    assert results[2][0] is None
+    assert isinstance(results[2][1], backend.DOIError)
+
+
+@pytest.mark.imported
+def test_fetch_bibtex_batch_caches_only_doi_org_output(tmp_path, monkeypatch):
+    called_urls = []
+    missing_doi = "10.9999/missing.1"
+    raw = """@article{sample,
+ author = {Doe, Jane},
+ title = {Not indexed},
+ year = {2025}
+}
+"""
+    responses = {
+        (
+            "https://api.crossref.org/works?"
+            f"filter=doi:10.1038/nphys1170,doi:{missing_doi}&rows=2"
+        ): FakeResponse(json_data={"message": {"items": [CROSSREF_ITEM]}}),
+        f"https://doi.org/{missing_doi}": FakeResponse(text=raw),
+    }
+    _install_fake_get(monkeypatch, responses, called_urls)
+    cache = BibtexCache(path=str(tmp_path / "doi.sqlite"))
+
+    backend.fetch_bibtex_batch(["10.1038/nphys1170", missing_doi], cache=cache)
+
+    assert cache.get("10.1038/nphys1170") is None
+    assert cache.get(missing_doi) == raw
+
+
+@pytest.mark.imported
+def test_fetch_bibtex_batch_uses_article_numbers_without_extra_requests(monkeypatch):
+    called_urls = []
+    dois = [f"10.1103/physrevb.110.04514{i}" for i in range(5)]
+    items = [
+        {
+            "DOI": doi,
+            "type": "journal-article",
+            "title": [f"Article {i}"],
+            "article-number": f"04514{i}",
+            "container-title": ["Physical Review B"],
+            "author": [{"given": "Jane", "family": "Doe"}],
+            "published-print": {"date-parts": [[2024, 7]]},
+        }
+        for i, doi in enumerate(dois)
+    ]
+    doi_filter = ",".join(f"doi:{doi}" for doi in dois)
+    responses = {
+        f"https://api.crossref.org/works?filter={doi_filter}&rows=5": FakeResponse(
+            json_data={"message": {"items": items}}
+        ),
+    }
+    _install_fake_get(monkeypatch, responses, called_urls)
+
+    results = backend.fetch_bibtex_batch(dois)
+
+    assert len(called_urls) == 1
+    for i, (bibtex, error) in enumerate(results):
+        assert error is None
+        assert f"pages = {{04514{i}}}" in bibtex
@@ -105,8 +105,12 @@ import pytest
         ),
     ],
 )
-def test_article_output(capfd, input_value, expected_output) -> None:
+def test_article_output(
+    capfd, monkeypatch, tmp_path, input_value, expected_output
+) -> None:
     """Check .bib generation at level of the CLI."""
+    # Keep the run off the user's DOI cache so doi.org is always queried.
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
     subprocess.run(f"python {PRG} {input_value}", shell=True, check=True)
     out, err = capfd.readouterr()
     assert expected_output.splitlines() == out.splitlines()
@@ -139,8 +143,12 @@ def test_article_output(capfd, input_value, expected_output) -> None:
 @pytest.mark.skipif(
     sys.platform.startswith("win"), reason="This test is not supported on Windows."
 )
-def test_article_fuzzy_title(capfd, input_value, expected_output) -> None:
+def test_article_fuzzy_title(
+    capfd, monkeypatch, tmp_path, input_value, expected_output
+) -> None:
     """Check .bib generation at level of the CLI."""
+    # Keep the run off the user's DOI cache so doi.org is always queried.
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
     subprocess.run(f"python {PRG} {input_value}", shell=True, check=True)
     out, err = capfd.readouterr()
     assert expected_output == out
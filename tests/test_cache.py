@@ -0,0 +1,98 @@
+from pathlib import Path
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from doi2bib3 import backend
+from doi2bib3.cache import BibtexCache
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text=""):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.apparent_encoding = "utf-8"
+        self.encoding = "utf-8"
+
+
+RAW_BIBTEX = """@article{sample,
+ author = {Doe, Jane},
+ title = {Cached result},
+ year = {2025},
+ pages = {1--2},
+ url = {https://doi.org/10.9999/cached.1}
+}
+"""
+
+
+def _install_fake_get(monkeypatch, called_urls):
+    def fake_get(url, headers=None, timeout=None):
+        called_urls.append(url)
+        if url != "https://doi.org/10.9999/cached.1":
+            raise AssertionError(f"Unexpected URL: {url}")
+        return FakeResponse(text=RAW_BIBTEX)
+
+    monkeypatch.setattr(backend.SESSION, "get", fake_get)
+
+
+@pytest.mark.imported
+def test_bibtex_cache_round_trip_is_case_insensitive(tmp_path):
+    cache = BibtexCache(path=str(tmp_path / "cache" / "doi.sqlite"))
+
+    assert cache.get("10.9999/Cached.1") is None
+    cache.set("10.9999/Cached.1", RAW_BIBTEX)
+
+    assert cache.get("10.9999/cached.1") == RAW_BIBTEX
+
+
+@pytest.mark.imported
+def test_bibtex_cache_expires_entries_after_ttl(tmp_path, monkeypatch):
+    cache = BibtexCache(path=str(tmp_path / "doi.sqlite"), ttl=60)
+    monkeypatch.setattr("doi2bib3.cache.time.time", lambda: 1000.0)
+    cache.set("10.9999/cached.1", RAW_BIBTEX)
+
+    monkeypatch.setattr("doi2bib3.cache.time.time", lambda: 1059.0)
+    assert cache.get("10.9999/cached.1") == RAW_BIBTEX
+    monkeypatch.setattr("doi2bib3.cache.time.time", lambda: 1061.0)
+    assert cache.get("10.9999/cached.1") is None
+
+
+@pytest.mark.imported
+def test_fetch_bibtex_reuses_cached_doi(tmp_path, monkeypatch):
+    called_urls = []
+    _install_fake_get(monkeypatch, called_urls)
+    cache = BibtexCache(path=str(tmp_path / "doi.sqlite"))
+
+    first = backend.fetch_bibtex("10.9999/cached.1", cache=cache)
+    second = backend.fetch_bibtex("doi:10.9999/cached.1", cache=cache)
+    backend.fetch_bibtex("10.9999/cached.1", cache=cache, refresh=True)
+
+    assert first == second
+    assert "@article{Doe_cached_2025," in first
+    assert called_urls == [
+        "https://doi.org/10.9999/cached.1",
+        "https://doi.org/10.9999/cached.1",
+    ]
+
+
+@pytest.mark.imported
+def test_bibtex_cache_creates_schema_once(tmp_path, monkeypatch):
+    cache = BibtexCache(path=str(tmp_path / "cache" / "doi.sqlite"))
+    makedirs_calls = []
+    real_makedirs = os.makedirs
+
+    def counting_makedirs(*args, **kwargs):
+        makedirs_calls.append(args)
+        return real_makedirs(*args, **kwargs)
+
+    monkeypatch.setattr("doi2bib3.cache.os.makedirs", counting_makedirs)
+    cache.set("10.9999/cached.1", RAW_BIBTEX)
+    cache.get("10.9999/cached.1")
+    cache.set("10.9999/cached.2", RAW_BIBTEX)
+
+    assert len(makedirs_calls) == 1
+    assert cache.get("10.9999/cached.2") == RAW_BIBTEX
@@ -0,0 +1,67 @@
+from pathlib import Path
+import runpy
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import doi2bib3
+from doi2bib3 import session
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "doi2bib3"
+
+
+def _load_cli(monkeypatch, fake_fetch_bibtex):
+    monkeypatch.setattr(doi2bib3, "fetch_bibtex", fake_fetch_bibtex)
+    monkeypatch.setattr(session, "install_dns_cache", lambda: None)
+    return runpy.run_path(str(SCRIPT), run_name="doi2bib3_cli")
+
+
+def _fake_fetch_bibtex(identifier, cache=None, refresh=False):
+    if identifier.startswith("bad"):
+        raise doi2bib3.backend.DOIError(f"cannot resolve {identifier}")
+    return f"@article{{{identifier}}}"
+
+
+@pytest.mark.imported
+def test_cli_outputs_several_identifiers_in_input_order(monkeypatch, capsys):
+    cli = _load_cli(monkeypatch, _fake_fetch_bibtex)
+
+    status = cli["main"](["--no-cache", "first", "second", "third"])
+
+    out, err = capsys.readouterr()
+    assert status == 0
+    assert out.splitlines() == [
+        "@article{first}",
+        "@article{second}",
+        "@article{third}",
+    ]
+    assert err == ""
+
+
+@pytest.mark.imported
+def test_cli_reports_each_failure_and_keeps_going(monkeypatch, capsys):
+    cli = _load_cli(monkeypatch, _fake_fetch_bibtex)
+
+    status = cli["main"](["--no-cache", "bad-one", "good", "bad-two"])
+
+    out, err = capsys.readouterr()
+    assert status == 1
+    assert out.splitlines() == ["@article{good}"]
+    assert err.splitlines() == [
+        "Error (bad-one): cannot resolve bad-one",
+        "Error (bad-two): cannot resolve bad-two",
+    ]
+
+
+@pytest.mark.imported
+def test_cli_single_failure_uses_plain_error_prefix(monkeypatch, capsys):
+    cli = _load_cli(monkeypatch, _fake_fetch_bibtex)
+
+    status = cli["main"](["--no-cache", "bad-one"])
+
+    out, err = capsys.readouterr()
+    assert status == 1
+    assert out == ""
+    assert err == "Error: cannot resolve bad-one\n"
@@ -0,0 +1,35 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from doi2bib3.io import save_bibtex_to_file
+
+
+def test_save_bibtex_to_file_appends_with_separating_newline(tmp_path):
+    path = tmp_path / "refs.bib"
+    path.write_bytes(b"@misc{a, title={\xc3\xa9}}")
+
+    save_bibtex_to_file("@misc{b, title={ü}}\n", str(path), append=True)
+    save_bibtex_to_file("@misc{c, title={c}}\n", str(path), append=True)
+
+    assert path.read_text(encoding="utf-8") == (
+        "@misc{a, title={é}}\n@misc{b, title={ü}}\n@misc{c, title={c}}\n"
+    )
+
+
+def test_save_bibtex_to_file_appends_to_missing_file(tmp_path):
+    path = tmp_path / "new.bib"
+
+    save_bibtex_to_file("@misc{a, title={a}}\n", str(path), append=True)
+
+    assert path.read_text(encoding="utf-8") == "@misc{a, title={a}}\n"
+
+
+def test_save_bibtex_to_file_overwrites_without_append(tmp_path):
+    path = tmp_path / "refs.bib"
+    path.write_text("old\n", encoding="utf-8")
+
+    save_bibtex_to_file("@misc{a, title={é}}\n", str(path))
+
+    assert path.read_bytes() == "@misc{a, title={é}}\n".encode("utf-8")
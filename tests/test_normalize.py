@@ -368,3 +368,48 @@ def test_physics_doi_fixtures_encode_title_and_author_diacritics(
         assert author_part in out
     for title_part in expected_title_parts:
         assert title_part in out
+
+
+def test_normalize_bibtex_single_entry_matches_bibtexparser_output():
+    raw = """@article{Doe_2020, title="Quoted {Title} value",
+ author={Doe, Jane}, year=2020, month=jul,
+ journal={Physical Review B}, pages={1-5}}
+"""
+
+    out = normalize_bibtex(raw)
+
+    assert out == (
+        "@article{Doe_quoted_2020,\n"
+        " author = {Doe, Jane},\n"
+        " journal = {Phys. Rev. B},\n"
+        " month = {July},\n"
+        " pages = {1--5},\n"
+        " title = {{Quoted} {Title} value},\n"
+        " year = {2020}\n"
+        "}\n"
+    )
+
+
+def test_normalize_bibtex_single_entry_expands_tabs_like_bibtexparser():
+    raw = "@article{Doe_2020,\n\ttitle={Tabbed\ttitle},\n note={\t  tab},\n year=2020\n}\n"
+
+    out = normalize_bibtex(raw)
+
+    assert out == (
+        "@article{tabbed_2020,\n"
+        " note = {   tab},\n"
+        " title = {{Tabbed} title},\n"
+        " year = {2020}\n"
+        "}\n"
+    )
+
+
+def test_normalize_bibtex_falls_back_for_multiple_entries():
+    raw = """@article{First_2020, title={First entry}, author={One, A.}, year={2020}}
+@article{Second_2021, title={Second entry}, author={Two, B.}, year={2021}}
+"""
+
+    out = normalize_bibtex(raw)
+
+    assert "@article{One_first_2020," in out
+    assert "@article{Two_second_2021," in out
@@ -25,7 +25,7 @@ def _install_fake_get(monkeypatch, responses, called_urls):
             raise AssertionError(f"Unexpected URL: {url}")
         return response
 
-    monkeypatch.setattr(backend.requests, "get", fake_get)
+    monkeypatch.setattr(backend.SESSION, "get", fake_get)
 
 
 @pytest.mark.imported
@@ -152,3 +152,34 @@ def test_scipost_pdf_url_fetches_bibtex_for_resolved_doi(monkeypatch):
     assert f"https://doi.org/{doi}" in bibtex
     assert f"https://doi.org/{doi}" in called_urls
     assert f"https://doi.org/{doi}/pdf" not in called_urls
+
+
+@pytest.mark.imported
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("10.1038/nphys1170", True),
+        ("10.1016/j.aop.2005.01.006", True),
+        ("10.123456789/x", True),
+        ("10.123/x", False),
+        ("10.1234567890/x", False),
+        ("10.12a4/x", False),
+        ("10.1234/", False),
+        ("10.1234/a b", False),
+        ("11.1234/x", False),
+        ("10.1234", False),
+    ],
+)
+def test_is_doi_matches_doi_syntax(value, expected):
+    assert backend._is_doi(value) is expected
+
+
+@pytest.mark.imported
+def test_decode_response_text_detects_latin1_body_labelled_utf8():
+    response = FakeResponse()
+    response.content = "author = {Müller, Jörg}, title = {Café}".encode("latin-1")
+    response.apparent_encoding = "ISO-8859-1"
+
+    assert backend._decode_response_text(response) == (
+        "author = {Müller, Jörg}, title = {Café}"
+    )
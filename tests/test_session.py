@@ -0,0 +1,36 @@
+from pathlib import Path
+import socket
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from doi2bib3 import session
+
+
+def test_install_dns_cache_reuses_successful_lookups(monkeypatch):
+    calls = []
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        calls.append((host, port))
+        if host == "missing.invalid":
+            raise socket.gaierror("not found")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", port))]
+
+    monkeypatch.setattr(socket, "getaddrinfo", fake_getaddrinfo)
+    session.install_dns_cache()
+    session.install_dns_cache()
+
+    first = socket.getaddrinfo("doi.org", 443)
+    second = socket.getaddrinfo("doi.org", 443)
+    for _ in range(2):
+        try:
+            socket.getaddrinfo("missing.invalid", 443)
+        except socket.gaierror:
+            pass
+
+    assert first == second
+    assert calls == [
+        ("doi.org", 443),
+        ("missing.invalid", 443),
+        ("missing.invalid", 443),
+    ]